@@ -1,15 +1,280 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+import mmap
 from pathlib import Path
 import re
 from datetime import datetime, timedelta
 import logging
 import shutil
+import signal
 import sys
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 from .file_manager import LogFileManager
 from .console import ConsoleUI
 from .exit import GracefulExit
 
+
+# Statement classifiers. Each alternative is a lookahead tried from the start of the line, so the first alternative
+# that occurs anywhere in the line wins and its named group (reported by Match.lastgroup) names the statement type.
+_JS_STATEMENT_PATTERN = re.compile(r"""
+    (?=.*?console\.(?P<console>\w+))
+""", re.VERBOSE | re.DOTALL)
+
+_PY_STATEMENT_PATTERN = re.compile(r"""
+    (?=.*?(?P<logging_import>import[ ]logging))
+  | (?=.*?(?P<logger_definition>getLogger))
+  | (?=.*?logger\.(?P<logger>\w+))
+  | (?=.*?(?P<logger_statement>logger\.))
+  | (?=.*?logging\.(?P<logging>\w+))
+  | (?=.*?(?P<logging_statement>logging\.))
+""", re.VERBOSE | re.DOTALL)
+
+# Statement types whose name is completed by the method captured in the group of the same name
+_METHOD_STATEMENT_TYPES = frozenset(('console', 'logger', 'logging'))
+
+# Files at least this large are memory-mapped rather than read and decoded into a string
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+@contextmanager
+def _open_source(file_path: str):
+    """
+    Opens a source file for scanning as raw bytes.
+
+    The content is never decoded as a whole: the candidate scan runs over the bytes and only candidate lines are
+    decoded. Small files are read in one call. Larger files are memory-mapped read-only, so pages are faulted in on
+    demand instead of being copied into memory.
+
+    The file itself is closed before anything is yielded, since some platforms cannot replace a file that is still
+    open. A mapping holds its own handle, so it has to be closed before the file it maps is replaced.
+
+    Args:
+        file_path (str): The path to the source file.
+
+    Yields:
+        Union[bytes, mmap.mmap]: The file content, or a read-only mapping of it.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < _MMAP_MIN_SIZE:
+            mapped = None
+            content = file.read()
+        else:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mapped is None:
+        yield content
+        return
+
+    with mapped:
+        yield mapped
+
+
+def _count_line_breaks(content: Union[bytes, mmap.mmap], start: int, end: int) -> int:
+    """
+    Counts the line breaks in content[start:end] as text mode reads them, where \r\n, \r and \n each end a line.
+
+    The range must not split a \r\n pair.
+    """
+    if isinstance(content, mmap.mmap):
+        # Mappings have no count method, so the range is copied out
+        content, start, end = content[start:end], 0, end - start
+
+    line_breaks = content.count(b'\n', start, end)
+    carriage_returns = content.count(b'\r', start, end)
+    if carriage_returns:
+        line_breaks += carriage_returns - content.count(b'\r\n', start, end)
+    return line_breaks
+
+
+@lru_cache(maxsize=4096)
+def _classify_statement(line: str, file_type: str) -> str:
+    """
+    Classifies a stripped line of code by the kind of logging statement it contains.
+
+    Logging boilerplate tends to repeat verbatim across a code base, so results are cached on the exact
+    (line, file_type) pair and identical statements are only matched once.
+
+    Args:
+        line (str): The stripped line of code to classify.
+        file_type (str): The type of the file (e.g., '.js', '.py').
+
+    Returns:
+        str: The statement type (e.g., 'console.log', 'logging.info'), or 'unknown'.
+    """
+    pattern = _STATEMENT_PATTERNS.get(file_type)
+    if pattern is None:
+        return 'unknown'
+
+    match = pattern.match(line)
+    if match is None:
+        return 'unknown'
+
+    statement_type = match.lastgroup
+    if statement_type in _METHOD_STATEMENT_TYPES:
+        return f"{statement_type}.{match.group(statement_type)}"
+    return statement_type
+
+
+class _StatementMatcher:
+    """
+    Compiled patterns for finding removable logging statements in source code.
+
+    Kept apart from LogCleaner, which holds UI, cron and logging state, so that it can be pickled and sent to worker
+    processes when files are scanned in parallel.
+
+    Args:
+        console_pattern (str): Pattern matching JavaScript/TypeScript console statements
+        python_patterns (Sequence[str]): Patterns matching Python logging statements
+    """
+    JS_EXTS = frozenset(('.js', '.jsx', '.ts', '.tsx'))
+    PY_EXTS = frozenset(('.py',))
+
+    def __init__(self, console_pattern: str, python_patterns: Sequence[str]):
+        self.compiled_python_pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in python_patterns),
+            re.MULTILINE | re.DOTALL
+        )
+        self.compiled_console_pattern = re.compile(
+            console_pattern,
+            re.MULTILINE | re.DOTALL
+        )
+
+        # Lines that are blank or whose first non-whitespace character starts a comment
+        self.compiled_comment_or_blank_pattern = re.compile(r'\s*(?:#|$)')
+
+        # File type -> (literal every statement pattern requires, statement pattern). Lines without
+        # the literal are never candidates.
+        self._dispatch = {}
+        for file_type in self.JS_EXTS:
+            self._dispatch[file_type] = ('console.', self.compiled_console_pattern)
+        for file_type in self.PY_EXTS:
+            self._dispatch[file_type] = ('logg', self.compiled_python_pattern)
+
+    def supports(self, file_type: str) -> bool:
+        """Returns True if statements can be matched in files of the given type."""
+        return file_type in self._dispatch
+
+    def should_remove_line(self, line: str, file_type: str) -> bool:
+        """
+        Determines if a specific line should be removed based on its content and file type.
+
+        Args:
+            line (str): The line of code to evaluate.
+            file_type (str): The type of the file (e.g., '.js', '.py').
+
+        Returns:
+            bool: True if the line should be removed; False otherwise.
+        """
+        entry = self._dispatch.get(file_type)
+        if entry is None:
+            return False
+        
+        # Every pattern requires the literal, so most lines are rejected by a
+        # plain substring test before any regex runs
+        literal, pattern = entry
+        if literal not in line:
+            return False
+
+        # Matched in place instead of stripping, which would copy the line
+        if self.compiled_comment_or_blank_pattern.match(line):
+            return False
+
+        return bool(pattern.search(line))
+
+    def find_removals(self, content: Union[bytes, mmap.mmap], file_type: str):
+        """
+        Finds the lines of a file's content that should be removed.
+
+        Candidate lines are located by searching the whole content for the literal every pattern requires, using the
+        vectorised substring search behind bytes.find and expanding each hit to its line. Only those lines are decoded
+        and checked individually against the statement patterns. As in text mode, \r\n, \r and \n all end a line.
+
+        Args:
+            content (Union[bytes, mmap.mmap]): The full content of the file, or a read-only mapping of it.
+            file_type (str): The type of the file (e.g., '.js', '.py').
+
+        Yields:
+            tuple[int, int, str]: The start byte offset, end byte offset and text (including its newline) of each
+            removable line.
+        """
+        entry = self._dispatch.get(file_type)
+        if entry is None:
+            return
+
+        literal, pattern = entry
+        literal = literal.encode('ascii')
+        statement_search = pattern.search
+
+        # This is the innermost loop of a run, so it is should_remove_line unrolled: the file type is resolved once
+        # above, the literal prefilter is already guaranteed by the candidate search, and the bound methods are held
+        # in locals to skip attribute lookups per line.
+        comment_or_blank_match = self.compiled_comment_or_blank_pattern.match
+        find = content.find
+        rfind = content.rfind
+        size = len(content)
+        has_carriage_return = find(b'\r') != -1
+        position = find(literal)
+        while position != -1:
+            start = rfind(b'\n', 0, position) + 1
+            end = find(b'\n', position)
+            end = size if end == -1 else end + 1
+
+            # A bare \r also ends a line. Both searches stay within the \n-delimited line, and
+            # a \r directly followed by its \n ends the line together with it.
+            if has_carriage_return:
+                start = max(start, rfind(b'\r', start, position) + 1)
+                carriage_return = find(b'\r', position, end)
+                if carriage_return != -1 and content[carriage_return + 1:carriage_return + 2] != b'\n':
+                    end = carriage_return + 1
+
+            line = content[start:end].decode('utf-8')
+            if not comment_or_blank_match(line) and statement_search(line):
+                yield start, end, line
+
+            position = find(literal, end)
+
+
+# Statement classifier for each supported file type, built from the matcher's extension sets so that
+# both always cover the same types
+_STATEMENT_PATTERNS = {
+    **dict.fromkeys(_StatementMatcher.JS_EXTS, _JS_STATEMENT_PATTERN),
+    **dict.fromkeys(_StatementMatcher.PY_EXTS, _PY_STATEMENT_PATTERN),
+}
+
+# Matcher used by worker processes, installed once per process by _init_worker
+_worker_matcher: Optional[_StatementMatcher] = None
+
+
+def _init_worker(matcher: _StatementMatcher) -> None:
+    """
+    Prepares a worker process for scanning files.
+
+    Stores the matcher for _needs_cleaning, so its patterns are unpickled and compiled once per process rather than
+    once per file. Interrupts are left to the parent process, which owns the graceful exit handling, and any
+    inherited termination handler is reset to the default.
+    """
+    global _worker_matcher
+    _worker_matcher = matcher
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _needs_cleaning(file_path: str) -> bool:
+    """
+    Checks in a worker process whether a file contains at least one removable statement.
+
+    Errors are reported as True so that the parent process retries the file and reports the error through the UI.
+    """
+    try:
+        file_type = os.path.splitext(file_path)[1]
+        with _open_source(file_path) as content:
+            return next(_worker_matcher.find_removals(content, file_type), None) is not None
+    except Exception:
+        return True
+
+
 class LogCleaner:
     """
     Utility class for cleaning log statements from various programming files (JavaScript, TypeScript, Python).
@@ -21,6 +286,10 @@ class LogCleaner:
 
     Attributes:
         ASSETS_DIR_NAME (str): Directory for cleaned assets
+        CONSOLE_METHODS (Tuple[str, ...]): Console methods whose calls are removed from JavaScript/TypeScript files
+        CONSOLE_PATTERN (str): Pattern matching calls to any of CONSOLE_METHODS
+        PARALLEL_MIN_FILES (int): Minimum number of files before scanning uses worker processes
+        PYTHON_PATTERNS (Tuple[str, ...]): Patterns matching Python logging statements
         SUPPORTED_EXTENSIONS (Dict[str, str]): Supported file extensions and their descriptions
 
     Args:
@@ -33,6 +302,9 @@ class LogCleaner:
     """
     ASSETS_DIR_NAME = 'lc-cleaned-assets'
     
+    # Minimum number of files before scanning is spread across worker processes
+    PARALLEL_MIN_FILES = 64
+    
     SUPPORTED_EXTENSIONS: Dict[str, str] = {
         '.js': 'JavaScript files',
         '.jsx': 'React JavaScript files',
@@ -41,6 +313,26 @@ class LogCleaner:
         '.py': 'Python files'
     }
     
+    CONSOLE_METHODS: Tuple[str, ...] = (
+        'log', 'error', 'warn', 'info', 'debug', 
+        'trace', 'dir', 'dirxml', 'table', 'count',
+        'countReset', 'assert', 'clear', 'group', 
+        'groupEnd', 'groupCollapsed', 'time', 'timeEnd',
+        'timeLog', 'profile', 'profileEnd'
+    )
+
+    PYTHON_PATTERNS: Tuple[str, ...] = (
+        r'import\s+logging\s*(?:as\s+\w+)?\s*',
+        r'from\s+logging\s+import\s+.*',
+        r'_?logger\s*=\s*logging\.getLogger\([^)]*\)',
+        r'logging\.[a-zA-Z]+\([^)]*\)',
+        r'_?logger\.[a-zA-Z]+\([^)]*\)',
+        r'logging\.[a-zA-Z]+\s*\(\s*(?:[^()]*?\s*\+?\s*)*[^()]*?\)',
+        r'_?logger\.[a-zA-Z]+\s*\(\s*(?:[^()]*?\s*\+?\s*)*[^()]*?\)'
+    )
+    
+    CONSOLE_PATTERN = rf'\bconsole\.({"|".join(CONSOLE_METHODS)})\s*\(\s*(?:[^;]*?\s*\+?\s*)*[^;]*?\);?'
+    
     def __init__(self, testing: bool = False):
         """
         Initializes the LogCleaner class by setting up the user interface (UI), exit handling, and default settings.
@@ -65,35 +357,11 @@ class LogCleaner:
         
         self.selected_types: Set[str] = set()
         
-        self.console_methods = [
-            'log', 'error', 'warn', 'info', 'debug', 
-            'trace', 'dir', 'dirxml', 'table', 'count',
-            'countReset', 'assert', 'clear', 'group', 
-            'groupEnd', 'groupCollapsed', 'time', 'timeEnd',
-            'timeLog', 'profile', 'profileEnd'
-        ]
-
-        self.python_patterns = [
-            r'import\s+logging\s*(?:as\s+\w+)?\s*',
-            r'from\s+logging\s+import\s+.*',
-            r'_?logger\s*=\s*logging\.getLogger\([^)]*\)',
-            r'logging\.[a-zA-Z]+\([^)]*\)',
-            r'_?logger\.[a-zA-Z]+\([^)]*\)',
-            r'logging\.[a-zA-Z]+\s*\(\s*(?:[^()]*?\s*\+?\s*)*[^()]*?\)',
-            r'_?logger\.[a-zA-Z]+\s*\(\s*(?:[^()]*?\s*\+?\s*)*[^()]*?\)'
-        ]
-        
-        methods_pattern = '|'.join(self.console_methods)
-        self.console_pattern = rf'\bconsole\.({methods_pattern})\s*\(\s*(?:[^;]*?\s*\+?\s*)*[^;]*?\);?'
+        self.console_methods = list(self.CONSOLE_METHODS)
+        self.python_patterns = list(self.PYTHON_PATTERNS)
+        self.console_pattern = self.CONSOLE_PATTERN
         
-        self.compiled_python_patterns = [
-            re.compile(pattern, re.MULTILINE | re.DOTALL) 
-            for pattern in self.python_patterns
-        ]
-        self.compiled_console_pattern = re.compile(
-            self.console_pattern, 
-            re.MULTILINE | re.DOTALL
-        )
+        self.matcher = self._shared_matcher()
         
         self.stats = {
             'files_processed': 0,
@@ -101,6 +369,31 @@ class LogCleaner:
             'removed_statements': {},
             'file_types_processed': {}
         }
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _shared_matcher(cls) -> _StatementMatcher:
+        """
+        Compiles the class's statement patterns into a matcher.
+
+        The matcher holds only compiled patterns and no per-session state, so it is built once per class and shared by
+        every instance rather than recompiled for each one.
+
+        Returns:
+            _StatementMatcher: The matcher for CONSOLE_PATTERN and PYTHON_PATTERNS.
+        """
+        return _StatementMatcher(cls.CONSOLE_PATTERN, cls.PYTHON_PATTERNS)
+
+    @property
+    def assets_dir(self) -> Optional[Path]:
+        """Directory for cleaned assets, or None before it is configured."""
+        return self._assets_dir
+
+    @assets_dir.setter
+    def assets_dir(self, assets_dir: Optional[Path]) -> None:
+        """Set the assets directory, precomputing the absolute path prefix used by should_backup_file."""
+        self._assets_dir = assets_dir
+        self._assets_prefix = os.path.join(os.path.abspath(assets_dir), '') if assets_dir else None
         
     def initialize_session(self) -> bool:
         """
@@ -614,9 +907,8 @@ class LogCleaner:
             raise RuntimeError("Assets directory not initialized")
             
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = self.assets_dir / 'backups'
-        self.current_backup_dir = backup_dir / f'backup_{timestamp}'
-        self.current_backup_dir.mkdir(parents=True, exist_ok=True)
+        self.current_backup_dir = os.path.join(self.assets_dir, 'backups', f'backup_{timestamp}')
+        os.makedirs(self.current_backup_dir, exist_ok=True)
     
     def setup_logging(self) -> None:
         """
@@ -662,7 +954,7 @@ class LogCleaner:
         Returns:
             bool: True if the file type is supported; False otherwise.
         """
-        return Path(file_path).suffix.lower() in self.SUPPORTED_EXTENSIONS
+        return os.path.splitext(os.fspath(file_path))[1].lower() in self.SUPPORTED_EXTENSIONS
     
         
     def validate_files(self, files: List[str]) -> tuple[List[str], List[str]]:
@@ -691,27 +983,24 @@ class LogCleaner:
                 
         return valid_files, invalid_files
     
-    def should_backup_file(self, file_path: Path) -> bool:
+    def should_backup_file(self, file_path: Union[str, Path]) -> bool:
         """
         Determines if a given file should be backed up based on its location relative to the assets directory.
 
         This method checks if the provided file path lies within the assets directory. Files outside this directory are eligible
-        for backup to prevent redundant backups of already cleaned files.
+        for backup to prevent redundant backups of already cleaned files. The check is a plain string prefix comparison
+        against the assets directory's absolute path, computed once when the directory is set.
 
         Args:
-            file_path (Path): The path to the file being considered for backup.
+            file_path (Union[str, Path]): The path to the file being considered for backup.
 
         Returns:
             bool: True if the file should be backed up; False otherwise.
         """
-        if not self.assets_dir:
+        if not self._assets_prefix:
             return True
             
-        try:
-            file_path.relative_to(self.assets_dir)
-            return False 
-        except ValueError:
-            return True  
+        return not os.path.join(os.path.abspath(file_path), '').startswith(self._assets_prefix)
     
     def process_files(self):
         """
@@ -722,8 +1011,11 @@ class LogCleaner:
         """
         try:
             if isinstance(self.source_path, list):
-                for file_path in self.source_path:
-                    self.remove_logging_statements(file_path)
+                if self._should_process_in_parallel(self.source_path):
+                    self._process_in_parallel(self.source_path)
+                else:
+                    for file_path in self.source_path:
+                        self.remove_logging_statements(file_path)
             else:
                 self.process_directory(self.source_path)
         except KeyboardInterrupt:
@@ -742,25 +1034,105 @@ class LogCleaner:
         Args:
             directory (str): The path to the directory to process.
         """
+        # selected_types may be any collection; a frozenset keeps the per-file check a hash lookup
+        selected_types = frozenset(self.selected_types)
+        file_paths = [
+            entry.path for entry in self._walk_files(directory)
+            if os.path.splitext(entry.name)[1].lower() in selected_types
+        ]
+        
+        if self._should_process_in_parallel(file_paths):
+            self._process_in_parallel(file_paths)
+            return
+        
         spinner = self.ui.spinner("Processing files")
         
-        for root, _, files in os.walk(directory):
-            if self.assets_dir and Path(root).is_relative_to(self.assets_dir):
-                continue
-                
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix.lower() in self.selected_types:
-                    spinner()
-                    self.remove_logging_statements(str(file_path))
-                    sys.stdout.write('\r' + self.ui.CLEAR_LINE)
+        for file_path in file_paths:
+            spinner()
+            self.remove_logging_statements(file_path)
+            sys.stdout.write('\r' + self.ui.CLEAR_LINE)
+
+    def _should_process_in_parallel(self, file_paths: List[str]) -> bool:
+        """
+        Decides whether a batch of files is large enough to be scanned by a pool of worker processes.
+
+        Starting worker processes costs more than scanning a handful of files, so small batches and single-core
+        machines are processed in-process.
+
+        Args:
+            file_paths (List[str]): The files about to be processed.
+
+        Returns:
+            bool: True if the files should be scanned in parallel; False otherwise.
+        """
+        return len(file_paths) >= self.PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1
+
+    def _process_in_parallel(self, file_paths: List[str]):
+        """
+        Processes files by scanning them across a pool of worker processes.
+
+        Each worker checks whether a file contains any removable statement, which is where nearly all of the time goes
+        since most files need no changes. Files that do need changes are then cleaned in this process by
+        remove_logging_statements, so backups, statistics, logging and output behave exactly as in sequential mode.
+
+        If the run is interrupted, files still queued for the workers are cancelled, so the exit does not wait for
+        them to be scanned.
+
+        Args:
+            file_paths (List[str]): The files to process.
+        """
+        self.ui.print_info(f"Scanning {len(file_paths)} files in parallel")
+        
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(self.matcher,)) as executor:
+            try:
+                results = executor.map(_needs_cleaning, file_paths, chunksize=16)
+                for file_path, needs_cleaning in zip(file_paths, results):
+                    if needs_cleaning:
+                        self.remove_logging_statements(file_path)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def _walk_files(self, directory: str):
+        """
+        Recursively yields the files within a directory, skipping the assets directory.
+
+        Uses os.scandir so file and directory checks are answered from the directory listing itself rather than a
+        separate stat call per entry. Symbolic links to directories are not followed, and directories that cannot be
+        listed are skipped, as os.walk does.
+
+        Args:
+            directory (str): The path to the directory to walk.
+
+        Yields:
+            os.DirEntry: An entry for each file found.
+        """
+        assets_dir = os.fspath(self.assets_dir) if self.assets_dir else None
+        
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        
+        with entries:
+            subdirectories = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != assets_dir:
+                        subdirectories.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+                    
+        for subdirectory in subdirectories:
+            yield from self._walk_files(subdirectory)
 
     def remove_logging_statements(self, file_path: str):
         """
         Removes logging statements from the specified file and tracks the removed lines.
 
         This method reads the contents of the file, identifies lines containing logging statements, and removes them. It also
-        logs the removals and updates the statistics regarding processed files and removed lines.
+        logs the removals and updates the statistics regarding processed files and removed lines. Only lines found by a
+        single candidate scan over the file content are evaluated individually.
 
         Args:
             file_path (str): The path to the file from which logging statements should be removed.
@@ -768,15 +1140,27 @@ class LogCleaner:
         try:
             file_type = os.path.splitext(file_path)[1]
             
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            if not self.matcher.supports(file_type):
+                return
 
             removed_lines = []
-            cleaned_lines = []
+            removed_spans = []
             file_modified = False
-            
-            for line_num, line in enumerate(lines, 1):
-                if self.should_remove_line(line, file_type):
+            line_num = 1
+            counted_to = 0
+
+            with _open_source(file_path) as content:
+                # The whole file is scanned before anything is counted, so a line that fails to
+                # decode leaves the statistics and the log untouched. Only the spans of removed
+                # lines are recorded; everything between them is copied straight to the output.
+                removals = []
+                for start, end, line in self.matcher.find_removals(content, file_type):
+                    line_num += _count_line_breaks(content, counted_to, start)
+                    counted_to = start
+                    removals.append((line_num, line))
+                    removed_spans.append((start, end))
+
+                for line_num, line in removals:
                     statement_type = self.get_statement_type(line, file_type)
                     self.stats['removed_statements'][statement_type] = \
                         self.stats['removed_statements'].get(statement_type, 0) + 1
@@ -786,18 +1170,16 @@ class LogCleaner:
 
                     if hasattr(self, 'logger'):
                         self.logger.info(f"Removed {statement_type} from {file_path} at line {line_num}: {line.strip()}")
-                else:
-                    cleaned_lines.append(line)
+
+                if file_modified:
+                    if self.should_backup:
+                        backup_path = self.make_backup(file_path)
+                        if hasattr(self, 'logger'):
+                            self.logger.info(f"Created backup at: {backup_path}")
+                    
+                    self._rewrite_file(file_path, content, removed_spans)
 
             if file_modified:
-                if self.should_backup:
-                    backup_path = self.make_backup(file_path)
-                    if hasattr(self, 'logger'):
-                        self.logger.info(f"Created backup at: {backup_path}")
-                
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.writelines(cleaned_lines)
-                
                 self.stats['files_processed'] += 1
                 self.stats['file_types_processed'][file_type] = \
                     self.stats['file_types_processed'].get(file_type, 0) + 1
@@ -816,6 +1198,53 @@ class LogCleaner:
             if hasattr(self, 'logger'):
                 self.logger.error(error_msg)
 
+    def _rewrite_file(self, file_path: str, content: Union[bytes, mmap.mmap], removed_spans: List[tuple]) -> None:
+        """
+        Rewrites a file with the given byte spans left out.
+
+        The surviving bytes are streamed from the original content into a temporary file next to the target through a
+        1 MiB buffered writer, so kept regions go out in large writes without being decoded, re-encoded or copied into a
+        cleaned version of the whole file. The temporary file then atomically replaces the original, keeping its
+        permission bits, so an interrupted run never leaves a half-written source file.
+
+        A symbolic link is resolved first, so the file it points to is cleaned and the link itself is kept. Replacing a
+        file would detach its other hard links or drop an owner or group the new file does not get, so such files are
+        overwritten in place from the temporary file instead.
+
+        A mapped original is closed before it is replaced, which some platforms require; _open_source has already
+        closed the file itself.
+
+        Args:
+            file_path (str): The path to the file being rewritten.
+            content (Union[bytes, mmap.mmap]): The original content of the file, or a read-only mapping of it.
+            removed_spans (List[tuple]): Sorted, non-overlapping (start, end) spans of content to drop.
+        """
+        file_path = os.path.realpath(file_path)
+        tmp_path = f"{file_path}.lc.tmp"
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as file, memoryview(content) as view:
+                kept_from = 0
+                for start, end in removed_spans:
+                    file.write(view[kept_from:start])
+                    kept_from = end
+                file.write(view[kept_from:])
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+            original_stat = os.stat(file_path)
+            tmp_stat = os.stat(tmp_path)
+            if (original_stat.st_nlink > 1 or original_stat.st_uid != tmp_stat.st_uid
+                    or original_stat.st_gid != tmp_stat.st_gid):
+                shutil.copyfile(tmp_path, file_path)
+                os.unlink(tmp_path)
+            else:
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
     def should_remove_line(self, line: str, file_type: str) -> bool:
         """
         Determines if a specific line should be removed based on its content and file type.
@@ -830,15 +1259,7 @@ class LogCleaner:
         Returns:
             bool: True if the line should be removed; False otherwise.
         """
-        stripped_line = line.strip()
-        if not stripped_line or stripped_line.startswith('#'):
-            return False
-        
-        if file_type in ['.js', '.jsx', '.ts', '.tsx']:
-            return bool(self.compiled_console_pattern.search(line))
-        elif file_type in ['.py']:
-            return any(pattern.search(line) for pattern in self.compiled_python_patterns)
-        return False
+        return self.matcher.should_remove_line(line, file_type)
 
     def get_statement_type(self, line: str, file_type: str) -> str:
         """
@@ -854,22 +1275,7 @@ class LogCleaner:
         Returns:
             str: A string indicating the type of logging statement (e.g., 'console.log', 'logging.info').
         """
-        if file_type in ['.js', '.jsx', '.ts', '.tsx']:
-            match = re.search(r'console\.(\w+)', line)
-            if match:
-                return f"console.{match.group(1)}"
-        elif file_type in ['.py']:
-            if 'import logging' in line:
-                return 'logging_import'
-            elif 'getLogger' in line:
-                return 'logger_definition'
-            elif '_logger.' in line or 'logger.' in line:
-                match = re.search(r'_?logger\.(\w+)', line)
-                return f"logger.{match.group(1)}" if match else 'logger_statement'
-            elif 'logging.' in line:
-                match = re.search(r'logging\.(\w+)', line)
-                return f"logging.{match.group(1)}" if match else 'logging_statement'
-        return 'unknown'
+        return _classify_statement(line.strip(), file_type)
     
     def make_backup(self, file_path: Union[str, Path]) -> Optional[Path]:
         """
@@ -887,30 +1293,33 @@ class LogCleaner:
         if not self.should_backup or not self.current_backup_dir:
             return None
             
-        file_path = Path(file_path).resolve()
+        file_path = os.path.realpath(file_path)
         
         if not self.should_backup_file(file_path):
             return None
             
         if isinstance(self.source_path, list):
-            source_base = Path(os.path.commonpath([str(Path(p).parent) for p in self.source_path]))
+            source_base = os.path.commonpath([os.path.dirname(p) for p in self.source_path])
         else:
-            source_base = Path(self.source_path)
+            source_base = self.source_path
         
+        # Files outside the source base (or on another drive) are backed up by name only
         try:
-            rel_path = file_path.relative_to(source_base)
+            rel_path = os.path.relpath(file_path, source_base)
         except ValueError:
-            rel_path = Path(file_path.name)
+            rel_path = os.path.basename(file_path)
+        if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+            rel_path = os.path.basename(file_path)
             
-        backup_path = self.current_backup_dir / rel_path
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        backup_path = os.path.join(self.current_backup_dir, rel_path)
+        os.makedirs(os.path.dirname(backup_path), exist_ok=True)
         
-        shutil.copy2(str(file_path), str(backup_path))
+        shutil.copy2(file_path, backup_path)
         
         if hasattr(self, 'logger'):
             self.logger.info(f"Created backup: {backup_path}")
             
-        return backup_path
+        return Path(backup_path)
     
     def print_summary(self):
         """
@@ -110,7 +110,11 @@ class ConsoleUI:
         Returns:
             str: The user's input as a string.
         """
-        return input(f"{self.CYAN}❯ {self.BOLD}{message}: {self.END}")
+        return self._input(f"{self.CYAN}❯ {self.BOLD}{message}: {self.END}")
+
+    def _input(self, prompt: str) -> str:
+        """Reads a line of user input; every prompt goes through here, so tests can replace it to feed answers."""
+        return input(prompt)
 
     def prompt_choice(self, question: str, options: List[str]) -> int:
         """
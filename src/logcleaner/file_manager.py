@@ -1,10 +1,113 @@
+import contextlib
 import os
 from pathlib import Path
-from datetime import datetime
-from typing import List
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Pattern, Tuple
 from crontab import CronTab
 import re
 
+# Fixed-width ISO-8601 formats and the length of a string rendered with them
+_ISO_FORMAT_WIDTHS = {
+    '%Y-%m-%d': 10,
+    '%Y-%m-%d %H:%M:%S': 19,
+    '%Y-%m-%dT%H:%M:%S': 19,
+}
+
+# Timestamp patterns and their strptime formats, compiled once per process and
+# shared by every LogFileManager instance
+_DATETIME_PATTERNS = tuple((re.compile(pattern), date_format) for pattern, date_format in (
+    (r'(\d{4}-\d{2}-\d{2})', '%Y-%m-%d'),
+    (r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', '%Y-%m-%d %H:%M:%S'),
+    (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S'),
+    (r'(\d{2}/\d{2}/\d{4})', '%m/%d/%Y'),
+    (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+\-]\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S%z'),
+    (r'([A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})', '%b %d %H:%M:%S %Y'),
+    (r'(\d{10})', '%s'),
+    (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)', '%Y-%m-%dT%H:%M:%S.%fZ'),
+    (r'([A-Za-z]{3} [A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})', '%a %b %d %H:%M:%S %Y'),
+    (r'(\d{8})', '%Y%m%d'),
+))
+
+# File name patterns that identify log files
+_LOG_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\.log(\.\d+)?$',  # matches .log, .log.1, .log.2, etc.
+    r'\.logs$',
+    r'\.(error|debug|info)$',
+    r'\.log\.[0-9A-Za-z-]+$'  # matches .log.old, .log.backup, etc.
+))
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str, date_format: str) -> datetime:
+    """
+    Parse a matched timestamp string, memoized on the exact text and format.
+
+    Busy logs repeat the same timestamp on many consecutive lines, so caching the
+    parse skips most datetime.strptime calls. datetime objects are immutable, which
+    makes sharing cached results safe.
+
+    The dominant ISO-8601 layouts are fixed width, so they are sliced into integers
+    directly instead of going through datetime.strptime. The slices are only taken when
+    the separators sit where the format puts them; anything else, such as a value matched
+    by a custom pattern with other separators, is left to strptime.
+    """
+    width = _ISO_FORMAT_WIDTHS.get(date_format)
+    if width == len(value) and value[4] == value[7] == '-':
+        if width == 10:
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        # The format's ninth character is its date/time separator (' ' or 'T')
+        if value[10] == date_format[8] and value[13] == value[16] == ':':
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]))
+    return datetime.strptime(value, date_format)
+
+
+@lru_cache(maxsize=4096)
+def _is_iso_date(value: str) -> bool:
+    """
+    Check whether a string is a valid YYYY-MM-DD calendar date, memoized on the exact text.
+
+    Lines of a busy log share the same date prefix, so each distinct day is only checked
+    once. Impossible dates such as 2023-02-30 are rejected, as parsing them would fail.
+    """
+    if not (len(value) == 10 and value[4] == value[7] == '-' and value[:4].isdecimal()
+            and value[5:7].isdecimal() and value[8:10].isdecimal()):
+        return False
+    try:
+        _parse_datetime(value, '%Y-%m-%d')
+    except ValueError:
+        return False
+    return True
+
+
+def _walk_directory(directory: str | Path):
+    """
+    Walk a directory tree top-down without following symbolic links.
+
+    Uses os.fwalk where the platform provides it, so each level is listed and stat'ed
+    relative to an open directory descriptor rather than by re-resolving the full path.
+    Falls back to os.walk elsewhere (e.g. Windows). Pruning the yielded dirs list in
+    place prevents descending into those directories with either walker.
+
+    Like os.walk, a top directory that is itself a symbolic link is walked. os.fwalk
+    would yield nothing for it, so it is given the resolved path and each root is
+    reported under the path that was passed in.
+
+    Yields:
+        tuple[str, List[str], List[str]]: (root, dirs, files) for each directory visited
+    """
+    if hasattr(os, 'fwalk'):
+        top = os.fspath(directory)
+        real_top = os.path.realpath(top)
+        for root, dirs, files, _ in os.fwalk(real_top, follow_symlinks=False):
+            relative_root = root[len(real_top):].lstrip(os.sep)
+            yield os.path.join(top, relative_root) if relative_root else top, dirs, files
+    else:
+        yield from os.walk(directory, followlinks=False)
+
+
 class LogFileManager:
     """
     Manages log file operations and automated cleaning schedules.
@@ -16,9 +119,9 @@ class LogFileManager:
         - Manages cron jobs for automation
 
     Attributes:
-        datetime_patterns (List[Tuple[str, str]]): Regex patterns for log timestamps
+        datetime_patterns (Tuple[Tuple[Pattern, str], ...]): Compiled regex patterns for log timestamps
         log_extensions (Set[str]): Recognized log file extensions
-        log_patterns (List[str]): Patterns for log file identification
+        log_patterns (Tuple[Pattern, ...]): Compiled patterns for log file identification
         job_comment_base (str): Base identifier for cron jobs
         user_cron (CronTab): User's crontab interface
         ui (ConsoleUI): User interaction interface
@@ -41,34 +144,33 @@ class LogFileManager:
         Sets up:
             - User's crontab for automation management.
             - Base identifier for cron jobs.
+            - Crontab write batching state (see batch_cron).
             - Common datetime patterns for log timestamps.
             - Recognized log file extensions and patterns for validation.
         """
         self.ui = ui
         self.user_cron = CronTab(user=True)
         self.job_comment_base = "log-cleaner-automated"
+        self._batching = False
         
-        self.datetime_patterns = [
-            (r'(\d{4}-\d{2}-\d{2})', '%Y-%m-%d'),
-            (r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', '%Y-%m-%d %H:%M:%S'),
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S'),
-            (r'(\d{2}/\d{2}/\d{4})', '%m/%d/%Y'),
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+\-]\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S%z'),
-            (r'([A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})', '%b %d %H:%M:%S %Y'),
-            (r'(\d{10})', '%s'),
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)', '%Y-%m-%dT%H:%M:%S.%fZ'),
-            (r'([A-Za-z]{3} [A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})', '%a %b %d %H:%M:%S %Y'),
-            (r'(\d{8})', '%Y%m%d'),
-        ]
+        self.datetime_patterns = _DATETIME_PATTERNS
         
         self.log_extensions = {'.log', '.logs', '.error', '.debug', '.info'}
-        self.log_patterns = [
-            r'\.log(\.\d+)?$',  # matches .log, .log.1, .log.2, etc.
-            r'\.logs$',
-            r'\.(error|debug|info)$',
-            r'\.log\.[0-9A-Za-z-]+$'  # matches .log.old, .log.backup, etc.
-        ]
+        self.log_patterns = _LOG_NAME_PATTERNS
     
+    @property
+    def datetime_patterns(self) -> Tuple[Tuple[Pattern, str], ...]:
+        """Timestamp patterns tried by extract_date, as (compiled regex, strptime format) pairs."""
+        return self._datetime_patterns
+
+    @datetime_patterns.setter
+    def datetime_patterns(self, patterns) -> None:
+        """Set timestamp patterns, compiling any that are given as raw strings."""
+        self._datetime_patterns = tuple(
+            (re.compile(pattern) if isinstance(pattern, str) else pattern, date_format)
+            for pattern, date_format in patterns
+        )
+
     def is_log_file(self, file_path: str | Path) -> bool:
         """
         Determine if a file is a valid log file through multiple validation methods.
@@ -82,7 +184,8 @@ class LogFileManager:
         - First validates file existence and accessibility
         - Checks file extension against known log extensions
         - Matches filename against common log file patterns
-        - If previous checks fail, examines file content for log-like structures
+        - If previous checks fail, examines file content for log-like structures,
+          stopping at the first line that contains a timestamp
         - Handles various file encoding and access issues gracefully
 
         Args:
@@ -107,28 +210,19 @@ class LogFileManager:
                 return True
                 
             file_name = path.name.lower()
-            if any(re.search(pattern, file_name) for pattern in self.log_patterns):
+            if any(pattern.search(file_name) for pattern in self.log_patterns):
                 return True
                 
             try:
                 with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = []
-                    for _ in range(5):
-                        try:
-                            line = next(f)
-                            lines.append(line.strip())
-                        except StopIteration:
-                            break
-
-                for line in lines:
-                    for pattern, _ in self.datetime_patterns:
-                        if re.search(pattern, line):
-                            return True
+                    return any(
+                        pattern.search(line)
+                        for line in islice(f, 5)
+                        for pattern, _ in self.datetime_patterns
+                    )
                             
             except (UnicodeDecodeError, IOError):
                 return False
-                
-            return False
             
         except Exception as e:
             self.ui.print_error(f"Error checking file {file_path}: {str(e)}")
@@ -147,6 +241,7 @@ class LogFileManager:
         Special handling:
         - Skips .git directories for performance
         - Prevents traversal into excluded directories
+        - Does not follow symbolic links, avoiding duplicate walks and link loops
 
         Args:
             directory (Union[str, Path]): Root directory to start the search from
@@ -156,18 +251,18 @@ class LogFileManager:
 
         Note:
             Optimized to handle large directory structures by pruning unnecessary paths early.
+            Paths are joined as plain strings during the walk; only discovered log files
+            are wrapped in Path objects.
         """
-        directory_path = Path(directory)
         log_files = []
-        for root, dirs, files in os.walk(directory_path):
+        for root, dirs, files in _walk_directory(directory):
             if '.git' in dirs:
-                dirs.remove('.git')  
-                
-            root_path = Path(root)
+                dirs.remove('.git')
+
             for file in files:
-                file_path = root_path / file
-                if '.git' not in str(file_path) and self.is_log_file(file_path):
-                    log_files.append(file_path)
+                file_path = os.path.join(root, file)
+                if '.git' not in file_path and self.is_log_file(file_path):
+                    log_files.append(Path(file_path))
         return log_files
 
     def clean_logs_before_date(self, log_files: List[Path], cutoff_date: datetime) -> int:
@@ -191,9 +286,12 @@ class LogFileManager:
 
         Note:
             Continues processing even if errors occur with individual files.
+            Lines that start with a valid ISO date are compared as strings against the cutoff
+            instead of being parsed; any other line goes through extract_date.
         """
         files_cleaned = 0
         total_lines_removed = 0
+        iso_cutoff = self._iso_cutoff(cutoff_date)
         
         for log_file in log_files:
             try:
@@ -207,15 +305,17 @@ class LogFileManager:
                 new_lines = []
                 
                 for line in lines:
-                    if not line.strip(): 
+                    if line.isspace():
                         new_lines.append(line)
                         continue
-                        
-                    log_date = self.extract_date(line)
-                    
-                    if log_date is None: 
-                        new_lines.append(line)
-                    elif log_date >= cutoff_date: 
+
+                    if iso_cutoff and _is_iso_date(line[:10]):
+                        keep = line[:10] >= iso_cutoff
+                    else:
+                        log_date = self.extract_date(line)
+                        keep = log_date is None or log_date >= cutoff_date
+
+                    if keep:
                         new_lines.append(line)
                     else: 
                         lines_removed += 1
@@ -236,6 +336,30 @@ class LogFileManager:
                 
         return files_cleaned, total_lines_removed
 
+    def _iso_cutoff(self, cutoff_date: datetime) -> Optional[str]:
+        """
+        Build the string bound used to compare ISO-dated lines without parsing them.
+
+        With the default patterns, a line that opens with YYYY-MM-DD resolves to midnight
+        of that day, so it is kept exactly when its date is on or after the first day whose
+        midnight is not before the cutoff. Because ISO dates sort lexicographically, that
+        comparison can be done directly on the line prefix.
+
+        Args:
+            cutoff_date (datetime): Date before which entries should be removed
+
+        Returns:
+            Optional[str]: The first retained day as YYYY-MM-DD, or None when the configured
+            patterns do not resolve ISO dates to midnight and every line must be parsed
+        """
+        if not self.datetime_patterns or self.datetime_patterns[0][1] != '%Y-%m-%d':
+            return None
+
+        first_day = cutoff_date.date()
+        if cutoff_date.time() != time.min:
+            first_day += timedelta(days=1)
+        return first_day.isoformat()
+
     def extract_date(self, line: str) -> datetime:
         """
         Extract and parse a datetime from a log line using multiple format patterns.
@@ -252,12 +376,13 @@ class LogFileManager:
 
         Note:
             Tries patterns in defined order; continues searching even if a pattern fails.
+            Parsed timestamps are cached, so repeated timestamps are only parsed once.
         """
         for pattern, date_format in self.datetime_patterns:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
                 try:
-                    return datetime.strptime(match.group(1), date_format)
+                    return _parse_datetime(match.group(1), date_format)
                 except ValueError:
                     continue
         return None
@@ -294,13 +419,39 @@ class LogFileManager:
             
             job.setall(f'{minute} {hour} * * *')
             
-            self.user_cron.write()
+            self._write_crontab()
             return True
             
         except Exception as e:
             self.ui.print_error(f"Error setting up cron job: {str(e)}")
             return False
         
+    @contextlib.contextmanager
+    def batch_cron(self):
+        """
+        Defer crontab writes until the end of a block of cron job changes.
+
+        Every setup or removal normally serializes the whole crontab back to disk. Inside
+        this context those writes are skipped and a single write happens on exit, so N
+        schedule changes cost one write instead of N.
+
+        Example:
+            with manager.batch_cron():
+                manager.setup_cron_job(script_path, "/var/log/app", hour=1)
+                manager.setup_cron_job(script_path, "/var/log/web", hour=2)
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.user_cron.write()
+
+    def _write_crontab(self) -> None:
+        """Write the crontab to disk unless writes are being batched."""
+        if not self._batching:
+            self.user_cron.write()
+
     def get_cron_jobs(self):
         """
         Retrieve all log cleaner cron jobs currently scheduled.
@@ -340,7 +491,7 @@ class LogFileManager:
         """
         try:
             self.user_cron.remove(job)
-            self.user_cron.write()
+            self._write_crontab()
             return True
         except Exception as e:
             self.ui.print_error(f"Error removing cron job: {str(e)}")
@@ -362,7 +513,7 @@ class LogFileManager:
             for job in self.user_cron:
                 if job.comment.startswith(self.job_comment_base):
                     self.user_cron.remove(job)
-            self.user_cron.write()
+            self._write_crontab()
             return True
         except Exception as e:
             self.ui.print_error(f"Error removing cron jobs: {str(e)}")
@@ -1,3 +1,66 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+from unittest.mock import Mock
+from crontab import CronItem, CronTab
+from src.logcleaner import ConsoleUI, LogFileManager
+
+
+@pytest.fixture(scope="module")
+def ui():
+    """Create a ConsoleUI instance shared by the tests of a module."""
+    return ConsoleUI()
+
+
+@pytest.fixture(scope="module")
+def module_mock_ui():
+    """Create a mock UI instance shared by the tests of a module."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_ui(module_mock_ui):
+    """Provide the module's mock UI with its recorded calls cleared."""
+    module_mock_ui.reset_mock()
+    return module_mock_ui
+
+
+@pytest.fixture(scope="module")
+def module_manager(module_mock_ui):
+    """Create a LogFileManager shared by the tests of a module, with a snapshot of its initial state."""
+    manager = LogFileManager(module_mock_ui)
+    return manager, dict(vars(manager))
+
+
+@pytest.fixture
+def manager(module_manager, mock_ui):
+    """Provide the module's LogFileManager restored to its initial state (cron handle, patterns, batching)."""
+    manager, initial_state = module_manager
+    vars(manager).clear()
+    vars(manager).update(initial_state)
+    return manager
+
+
+@pytest.fixture
+def mock_cron():
+    """Create a mock CronTab, specced against the real API, whose new() returns a fresh mock CronItem."""
+    cron = Mock(spec=CronTab)
+    cron.new.return_value = Mock(spec=CronItem)
+    return cron
+
+
+@pytest.fixture
+def mock_cron_job(mock_cron):
+    """Provide the job mock that mock_cron.new() returns, for tests that need a single cron job."""
+    return mock_cron.new.return_value
+
+
+@pytest.fixture
+def feed_input(ui, monkeypatch):
+    """Return a function that makes the ui fixture's prompts answer with the given values, in order."""
+    def feed(values):
+        answers = iter(values)
+        monkeypatch.setattr(ui, '_input', lambda _: next(answers))
+    return feed
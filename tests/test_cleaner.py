@@ -1,23 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import Mock
 import pytest
 import os
-import shutil
-import tempfile
+import signal
 from pathlib import Path
 from src.logcleaner import LogCleaner
 
 class TestLogCleaner:
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    def temp_dir(self, tmp_path_factory):
+        """Create a temporary directory for test files under the session's base temp directory."""
+        return str(tmp_path_factory.mktemp('cleaner'))
 
     @pytest.fixture
-    def cleaner(self):
-        """Create a LogCleaner instance."""
-        cleaner = LogCleaner()
+    def cleaner(self, monkeypatch):
+        """Create a LogCleaner instance without letting it install real signal handlers."""
+        with monkeypatch.context() as patch:
+            patch.setattr(signal, 'signal', lambda *args, **kwargs: None)
+            cleaner = LogCleaner()
         yield cleaner
 
     @pytest.fixture
@@ -81,13 +81,10 @@ class TestLogCleaner:
         cleaner.process_files()
         
         # Verify
-        with open(sample_files['js']) as f:
-            content = f.read()
-            assert 'console.log' not in content
-            assert 'console.error' not in content
-            assert 'console.warn' not in content
-            assert 'function test()' in content
-            assert 'return true;' in content
+        content = sample_files['js'].read_text()
+        removed = ('console.log', 'console.error', 'console.warn')
+        assert not any(statement in content for statement in removed)
+        assert all(code in content for code in ('function test()', 'return true;'))
 
     @pytest.mark.integration
     def test_process_files_python(self, cleaner, sample_files, temp_dir):
@@ -100,13 +97,71 @@ class TestLogCleaner:
         cleaner.process_files()
         
         # Verify
-        with open(sample_files['py']) as f:
-            content = f.read()
-            assert 'import logging' not in content
-            assert 'logger.info' not in content
-            assert 'logging.error' not in content
-            assert 'def test():' in content
-            assert 'return True' in content
+        content = sample_files['py'].read_text()
+        removed = ('import logging', 'logger.info', 'logging.error')
+        assert not any(statement in content for statement in removed)
+        assert all(code in content for code in ('def test():', 'return True'))
+
+    def test_process_directory_unreadable_subdirectory(self, cleaner, sample_files, temp_dir, monkeypatch):
+        """Test that a directory which cannot be listed is skipped rather than aborting the run."""
+        # Setup
+        locked_dir = os.path.join(temp_dir, "locked")
+        os.mkdir(locked_dir)
+        scandir = os.scandir
+
+        def guarded_scandir(path):
+            if path == locked_dir:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', guarded_scandir)
+        cleaner.source_path = temp_dir
+        cleaner.selected_types = {'.py'}
+
+        # Process
+        cleaner.process_files()
+
+        # Verify
+        assert 'import logging' not in sample_files['py'].read_text()
+
+    @pytest.mark.integration
+    def test_process_files_parallel(self, cleaner, sample_files, temp_dir, monkeypatch):
+        """Test processing files through the worker process pool."""
+        # Setup
+        monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+        cleaner.PARALLEL_MIN_FILES = 1
+        cleaner.source_path = str(temp_dir)
+        cleaner.selected_types = ['.js', '.py']
+        
+        # Process files
+        cleaner.process_files()
+        
+        # Verify
+        assert cleaner.stats['files_processed'] == 2
+        assert cleaner.stats['lines_removed'] == 7
+        assert 'console.log' not in sample_files['js'].read_text()
+        assert 'logger.info' not in sample_files['py'].read_text()
+
+    @pytest.mark.integration
+    def test_process_files_parallel_interrupted(self, cleaner, sample_files, monkeypatch):
+        """Test that an interrupt cancels the files still queued for the worker pool."""
+        # Setup
+        shutdowns = []
+        shutdown = ProcessPoolExecutor.shutdown
+
+        def recording_shutdown(executor, wait=True, *, cancel_futures=False):
+            shutdowns.append(cancel_futures)
+            shutdown(executor, wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(ProcessPoolExecutor, 'shutdown', recording_shutdown)
+        monkeypatch.setattr(cleaner, 'remove_logging_statements', Mock(side_effect=KeyboardInterrupt))
+
+        # Process
+        with pytest.raises(KeyboardInterrupt):
+            cleaner._process_in_parallel([str(path) for path in sample_files.values()])
+
+        # Verify
+        assert shutdowns[0] is True
 
     @pytest.mark.integration
     def test_backup_creation(self, cleaner, sample_files, temp_dir):
@@ -129,8 +184,11 @@ class TestLogCleaner:
         backup_files = [f for f in backup_files if f.is_file()]
         assert len(backup_files) >= 2  # At least original JS and PY files
 
-    def test_initialize_session_complete(self, cleaner, monkeypatch):
+    def test_initialize_session_complete(self, cleaner, tmp_path, monkeypatch):
         """Test complete initialization session flow."""
+        # The session cleans '.', so run it from a temporary directory to keep its assets out of the checkout
+        monkeypatch.chdir(tmp_path)
+
         # Mock all UI interactions
         mock_responses = {
             'prompt_choice': [1, 1],  # First for cleaning mode, second for source selection
@@ -156,7 +214,7 @@ class TestLogCleaner:
     @pytest.mark.parametrize("file_content,file_type,expected_removals", [
         ("console.log('test');\nvalid code;\nconsole.error('test');", '.js', 2),
         ("import logging\nvalid code\nlogger.info('test')", '.py', 2),
-    ])
+    ], ids=['js', 'py'])
     def test_removal_counting(self, cleaner, temp_dir, file_content, file_type, expected_removals):
         """Test counting of removed statements."""
         # Setup
@@ -172,6 +230,140 @@ class TestLogCleaner:
         # Verify
         assert cleaner.stats['lines_removed'] == expected_removals
         
+    def test_remove_logging_statements_multiline_call(self, cleaner, temp_dir):
+        """Test that statements spanning several lines are left intact rather than partly removed."""
+        # Setup
+        content = "def test():\n    logging.info('value: %s',\n                 value)\n    return True\n"
+        test_file = Path(temp_dir) / "test.py"
+        test_file.write_text(content)
+
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert cleaner.stats['lines_removed'] == 0
+        assert test_file.read_text() == content
+
+    def test_remove_logging_statements_large_file(self, cleaner, temp_dir):
+        """Test removal from a file large enough to be memory-mapped."""
+        # Setup
+        body = "def test():\n    return True\n" * 4000
+        test_file = Path(temp_dir) / "test.py"
+        test_file.write_text("import logging\n" + body + "logger.info('test')\n" + body)
+
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert cleaner.stats['lines_removed'] == 2
+        assert test_file.read_text() == body + body
+
+    @pytest.mark.parametrize("repeat", [1, 8000], ids=['small', 'mapped'])
+    def test_remove_logging_statements_carriage_return_lines(self, cleaner, temp_dir, repeat):
+        """Test that a bare carriage return ends a line, as it does when reading in text mode."""
+        # Setup
+        body = b"  return 1;\r" * repeat
+        test_file = Path(temp_dir) / "test.js"
+        test_file.write_bytes(b"function a() {\r  console.log('x');\r" + body + b"}\r")
+
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert cleaner.stats['lines_removed'] == 1
+        assert test_file.read_bytes() == b"function a() {\r" + body + b"}\r"
+
+    def test_remove_logging_statements_undecodable_line(self, cleaner, temp_dir):
+        """Test that a file with a line that cannot be decoded is left alone and not counted."""
+        # Setup
+        test_file = Path(temp_dir) / "test.py"
+        content = b"import logging\nx = 1\nlogger.info('\xff')\n"
+        test_file.write_bytes(content)
+
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert cleaner.stats['lines_removed'] == 0
+        assert cleaner.stats['removed_statements'] == {}
+        assert test_file.read_bytes() == content
+
+    @pytest.mark.parametrize("repeat", [1, 4000], ids=['small', 'mapped'])
+    def test_remove_logging_statements_closes_source(self, cleaner, temp_dir, monkeypatch, repeat):
+        """Test that no handle to the source file is open when it is replaced."""
+        if not os.path.isdir('/proc/self/fd'):
+            pytest.skip("open file descriptors cannot be listed here")
+
+        # Setup
+        test_file = Path(temp_dir) / "test.py"
+        test_file.write_text("import logging\n" + "x = 1\n" * repeat)
+        source_path = os.path.realpath(test_file)
+        open_at_replace = []
+        replace = os.replace
+
+        def checking_replace(src, dst):
+            for fd in os.listdir('/proc/self/fd'):
+                if os.path.realpath(f'/proc/self/fd/{fd}') == source_path:
+                    open_at_replace.append(fd)
+            replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', checking_replace)
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert cleaner.stats['lines_removed'] == 1
+        assert open_at_replace == []
+
+    def test_remove_logging_statements_keeps_line_endings(self, cleaner, temp_dir):
+        """Test that kept lines are written back byte for byte."""
+        # Setup
+        test_file = Path(temp_dir) / "test.py"
+        test_file.write_bytes(b"import logging\r\nx = 1\r\nlogger.info('test')\r\ny = 2\r\n")
+
+        cleaner.source_path = [str(test_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(test_file))
+
+        # Verify
+        assert test_file.read_bytes() == b"x = 1\r\ny = 2\r\n"
+
+    @pytest.mark.parametrize("link", ['symlink', 'hardlink'])
+    def test_remove_logging_statements_linked_file(self, cleaner, temp_dir, link):
+        """Test that a linked file is cleaned through the link and stays linked."""
+        # Setup
+        real_file = Path(temp_dir) / "real.py"
+        real_file.write_text("import logging\nx = 1\n")
+        linked_file = Path(temp_dir) / "link.py"
+        try:
+            if link == 'symlink':
+                linked_file.symlink_to(real_file)
+            else:
+                linked_file.hardlink_to(real_file)
+        except OSError:
+            pytest.skip(f"{link}s are not supported here")
+
+        cleaner.source_path = [str(linked_file)]
+
+        # Process
+        cleaner.remove_logging_statements(str(linked_file))
+
+        # Verify
+        assert real_file.read_text() == "x = 1\n"
+        assert linked_file.is_symlink() == (link == 'symlink')
+        assert os.path.samefile(linked_file, real_file)
+
     def test_validate_file_type(self, cleaner):
         """Test file type validation."""
         valid_files = [
@@ -206,7 +398,11 @@ class TestLogCleaner:
         
         # Test files inside assets directory
         assert cleaner.should_backup_file(asset_file) is False
-        
+
+        # Test sibling directory sharing the assets directory's name as a prefix
+        sibling_file = tmp_path / "lc-cleaned-assets-old" / "asset.js"
+        assert cleaner.should_backup_file(sibling_file) is True
+
         # Test when assets_dir is not set
         cleaner.assets_dir = None
         assert cleaner.should_backup_file(test_file) is True
@@ -387,6 +583,3 @@ class TestLogCleaner:
         
         result = cleaner._handle_automation_management()
         assert isinstance(result, int)
-        
-if __name__ == '__main__':
-    pytest.main(['-v'])
\ No newline at end of file
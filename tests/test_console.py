@@ -1,43 +1,32 @@
 import pytest
-from src.logcleaner import ConsoleUI
 
 class TestConsoleUI:
-    @pytest.fixture
-    def ui(self):
-        """Create a ConsoleUI instance."""
-        return ConsoleUI()
-
-    def test_print_logo(self, ui, capsys):
+    def test_print_logo(self, ui, capfd):
         """Test printing the application logo."""
         ui.print_logo()
-        captured = capsys.readouterr()
-        assert "Log Cleaner v1.0.0" in captured.out
-        assert ui.CYAN in captured.out
-        assert ui.BOLD in captured.out
+        out = capfd.readouterr().out
+        assert all(text in out for text in ("Log Cleaner v1.0.0", ui.CYAN, ui.BOLD))
 
-    def test_print_step(self, ui, capsys):
+    def test_print_step(self, ui, capfd):
         """Test printing the current step."""
         ui.print_step("Test Step", 3, 1)
-        captured = capsys.readouterr()
-        assert "Step 1/3" in captured.out
-        assert "Test Step" in captured.out
+        out = capfd.readouterr().out
+        assert all(text in out for text in ("Step 1/3", "Test Step"))
 
-    def test_print_success(self, ui, capsys):
+    def test_print_success(self, ui, capfd):
         """Test printing a success message."""
         ui.print_success("Test Success")
-        captured = capsys.readouterr()
-        assert "✓ Test Success" in captured.out
-        assert ui.GREEN in captured.out
+        out = capfd.readouterr().out
+        assert all(text in out for text in ("✓ Test Success", ui.GREEN))
 
     @pytest.mark.parametrize("input_values, expected", [
         (['1'], 1),
         (['invalid', '2'], 2),
         (['0', '3'], 3),
     ])
-    def test_prompt_choice(self, ui, input_values, expected, monkeypatch):
+    def test_prompt_choice(self, ui, input_values, expected, feed_input):
         """Test prompting the user for a choice from a list of options."""
-        inputs = iter(input_values)
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+        feed_input(input_values)
         result = ui.prompt_choice("Test choices", ["Option 1", "Option 2", "Option 3"])
         assert result == expected
 
@@ -47,13 +36,8 @@ class TestConsoleUI:
         (['invalid', 'yes'], True),
         (['invalid', 'no'], False),
     ])
-    def test_prompt_yes_no(self, ui, input_values, expected, monkeypatch):
+    def test_prompt_yes_no(self, ui, input_values, expected, feed_input):
         """Test prompting the user for a yes/no response."""
-        inputs = iter(input_values)
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+        feed_input(input_values)
         result = ui.prompt_yes_no("Test yes/no")
         assert result == expected
-        
-if __name__ == '__main__':
-    pytest.main(['-v'])        
-  
\ No newline at end of file
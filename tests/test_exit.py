@@ -1,18 +1,12 @@
 import pytest
-from unittest.mock import Mock
 import signal
-from src.logcleaner import GracefulExit, LogCleaner
+from src.logcleaner import GracefulExit
 
 class TestGracefulExit:
     @pytest.fixture
-    def ui(self):
-        """Create a mock ConsoleUI instance."""
-        return Mock()
-
-    @pytest.fixture
-    def graceful_exit(self, ui):
+    def graceful_exit(self, mock_ui):
         """Create a GracefulExit instance in testing mode."""
-        return GracefulExit(ui, testing=True)
+        return GracefulExit(mock_ui, testing=True)
 
     def test_exit_handler(self, graceful_exit):
         """Test the exit handler raises KeyboardInterrupt in test mode."""
@@ -35,11 +29,3 @@ class TestGracefulExit:
         assert graceful_exit.ui.print_error.called
         error_msg = graceful_exit.ui.print_error.call_args[0][0]
         assert "Force quitting..." in error_msg
-    
-    @pytest.fixture
-    def cleaner(self):
-        """Create a LogCleaner instance in testing mode."""
-        return LogCleaner(testing=True)
-
-if __name__ == '__main__':
-    pytest.main(['-v'])
\ No newline at end of file
@@ -1,73 +1,69 @@
 import pytest
+import re
 import shutil
-import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from unittest.mock import Mock
-from src.logcleaner import LogFileManager
 
-class TestLogFileManager:
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def mock_ui(self):
-        """Create a mock UI instance."""
-        return Mock()
+# ISO and bracketed timestamp patterns for test_extract_date, compiled once at import
+_DATE_PATTERNS = [
+    (re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'\[([A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})\]'), '%b %d %H:%M:%S %Y')
+]
 
-    @pytest.fixture
-    def manager(self, mock_ui):
-        """Create a LogFileManager instance with mock UI."""
-        return LogFileManager(mock_ui)
-
-    @pytest.fixture
-    def sample_log_files(self, temp_dir):
-        """Create sample log files with different formats and content."""
+class TestLogFileManager:
+    @pytest.fixture(scope="module")
+    def sample_log_files(self, tmp_path_factory):
+        """Create sample log files with different formats and content, once per module."""
+        temp_dir = tmp_path_factory.mktemp("logs")
         files = {}
         
         # Standard log file with ISO format dates
-        iso_content = """
+        iso_content = b"""
         2024-02-15 10:30:45 INFO Started application
         2024-02-15 10:30:46 DEBUG Initializing components
         2024-02-15 10:30:47 ERROR Failed to connect
         """
-        iso_file = Path(temp_dir) / "app.log"
-        iso_file.write_text(iso_content)
+        iso_file = temp_dir / "app.log"
+        iso_file.write_bytes(iso_content)
         files["iso"] = iso_file
 
         # Log file with Unix timestamp format
-        unix_content = """
+        unix_content = b"""
         1644915045 Started backup process
         1644915046 Backup completed
         1644915047 Cleanup started
         """
-        unix_file = Path(temp_dir) / "system.log"
-        unix_file.write_text(unix_content)
+        unix_file = temp_dir / "system.log"
+        unix_file.write_bytes(unix_content)
         files["unix"] = unix_file
 
         # Log file with custom format
-        custom_content = """
+        custom_content = b"""
         [Feb 15 10:30:45 2024] Server started
         [Feb 15 10:30:46 2024] Connection accepted
         [Feb 15 10:30:47 2024] Request processed
         """
-        custom_file = Path(temp_dir) / "server.log"
-        custom_file.write_text(custom_content)
+        custom_file = temp_dir / "server.log"
+        custom_file.write_bytes(custom_content)
         files["custom"] = custom_file
 
         return files
 
-    def test_is_log_file_extension(self, manager, temp_dir):
+    @pytest.fixture
+    def sample_log_copies(self, sample_log_files, tmp_path):
+        """Copy the sample log files into a fresh directory for tests that modify or count them."""
+        return {
+            name: Path(shutil.copy2(log_file, tmp_path))
+            for name, log_file in sample_log_files.items()
+        }
+
+    def test_is_log_file_extension(self, manager, tmp_path):
         """Test log file detection based on file extension."""
         # Create test files
-        log_file = Path(temp_dir) / "test.log"
+        log_file = tmp_path / "test.log"
         log_file.write_text("some log content")
         
-        txt_file = Path(temp_dir) / "test.txt"
+        txt_file = tmp_path / "test.txt"
         txt_file.write_text("some text content")
         
         # Test valid log extensions
@@ -77,18 +73,18 @@ class TestLogFileManager:
         # Test non-log extensions
         assert manager.is_log_file(txt_file) is False
 
-    def test_is_log_file_content(self, manager, temp_dir):
+    def test_is_log_file_content(self, manager, tmp_path):
         """Test log file detection based on content patterns."""
         # File with log-like content but wrong extension
         log_content = """2024-02-15 10:30:45 INFO Test message
     2024-02-15 10:30:46 ERROR Another message
     2024-02-15 10:30:47 DEBUG Third message"""
-        fake_txt = Path(temp_dir) / "log_like.txt"
+        fake_txt = tmp_path / "log_like.txt"
         fake_txt.write_text(log_content)
         
         # File with non-log content but .log extension
         non_log_content = "This is just a regular text file\nwithout any log patterns"
-        fake_log = Path(temp_dir) / "fake.log"
+        fake_log = tmp_path / "fake.log"
         fake_log.write_text(non_log_content)
         
         # Test file detection
@@ -96,138 +92,167 @@ class TestLogFileManager:
         assert manager.is_log_file(fake_log) is True, "File with .log extension should be detected"
         
         # Test file with neither log extension nor log content
-        random_txt = Path(temp_dir) / "random.txt"
+        random_txt = tmp_path / "random.txt"
         random_txt.write_text("Just some random text\nwithout any dates or log patterns")
         assert manager.is_log_file(random_txt) is False, "File without log content or extension should not be detected"
 
-    def test_get_log_files(self, manager, sample_log_files, temp_dir):
+    def test_get_log_files(self, manager, sample_log_copies, tmp_path):
         """Test recursive log file discovery."""
         # Create nested directory structure
-        nested_dir = Path(temp_dir) / "nested"
+        nested_dir = tmp_path / "nested"
         nested_dir.mkdir()
         
         nested_log = nested_dir / "nested.log"
         nested_log.write_text("2024-02-15 10:30:45 INFO Nested log")
         
         # Create .git directory with log file that should be ignored
-        git_dir = Path(temp_dir) / ".git"
+        git_dir = tmp_path / ".git"
         git_dir.mkdir()
         git_log = git_dir / "git.log"
         git_log.write_text("some git log content")
         
         # Get all log files
-        log_files = manager.get_log_files(temp_dir)
+        log_files = manager.get_log_files(str(tmp_path))
         
-        # Verify results
-        assert len(log_files) == len(sample_log_files) + 1  # +1 for nested log
-        assert nested_log in log_files
-        assert git_log not in log_files  # .git directory should be ignored
-        assert all(Path(f).exists() for f in log_files)
+        # Verify results: every sample plus the nested log, and nothing from .git
+        assert git_log not in log_files
+        assert set(log_files) == {*sample_log_copies.values(), nested_log}
+
+    def test_get_log_files_symlinked_directory(self, manager, tmp_path):
+        """Test a log directory that is a symbolic link is searched like the directory itself."""
+        real_dir = tmp_path / "logs_real"
+        (real_dir / "nested").mkdir(parents=True)
+        (real_dir / "a.log").write_text("2024-02-15 10:30:45 INFO A")
+        (real_dir / "nested" / "b.log").write_text("2024-02-15 10:30:45 INFO B")
 
-    def test_clean_logs_before_date(self, manager, sample_log_files):
+        link_dir = tmp_path / "logs"
+        try:
+            link_dir.symlink_to(real_dir, target_is_directory=True)
+        except OSError:
+            pytest.skip("symbolic links are not supported here")
+
+        log_files = manager.get_log_files(str(link_dir))
+
+        assert set(log_files) == {link_dir / "a.log", link_dir / "nested" / "b.log"}
+
+    def test_clean_logs_before_date(self, manager, sample_log_copies):
         """Test log cleaning based on date."""
         cutoff_date = datetime.now() - timedelta(days=1)
         
         # Process all sample log files
         files_cleaned, lines_removed = manager.clean_logs_before_date(
-            list(sample_log_files.values()),
+            list(sample_log_copies.values()),
             cutoff_date
         )
         
         # Verify results
         assert isinstance(files_cleaned, int)
         assert isinstance(lines_removed, int)
-        assert files_cleaned <= len(sample_log_files)
+        assert files_cleaned <= len(sample_log_copies)
         
         # Check file contents after cleaning
-        for log_file in sample_log_files.values():
-            with open(log_file) as f:
-                content = f.read()
-                # Verify that empty lines are preserved
-                assert any(line.strip() == '' for line in content.split('\n'))
+        for log_file in sample_log_copies.values():
+            # Verify that empty lines are preserved (each sample starts with one)
+            content = log_file.read_bytes()
+            assert content.startswith(b"\n") or b"\n\n" in content
+
+    def test_clean_logs_before_date_iso_prefix(self, manager, tmp_path):
+        """Test ISO-prefixed lines are kept or removed by calendar day."""
+        log_file = tmp_path / "iso.log"
+        log_file.write_text(
+            "2024-02-14 23:59:59 INFO Old entry\n"
+            "2024-02-15 08:00:00 INFO Same day entry\n"
+            "\n"
+            "2024-02-16 00:00:00 INFO New entry\n"
+            "2023-02-30 10:00:00 INFO Impossible date\n"
+            "2023-1x-05 10:00:00 INFO Malformed date\n"
+        )
+
+        files_cleaned, lines_removed = manager.clean_logs_before_date(
+            [log_file],
+            datetime(2024, 2, 15)
+        )
+
+        # Lines whose date cannot be parsed are kept, as with any undated line
+        assert (files_cleaned, lines_removed) == (1, 1)
+        assert log_file.read_text() == (
+            "2024-02-15 08:00:00 INFO Same day entry\n"
+            "\n"
+            "2024-02-16 00:00:00 INFO New entry\n"
+            "2023-02-30 10:00:00 INFO Impossible date\n"
+            "2023-1x-05 10:00:00 INFO Malformed date\n"
+        )
+
+    @pytest.fixture
+    def date_manager(self, manager):
+        """Provide the manager with datetime patterns for ISO and bracketed timestamps, restored afterwards."""
+        original_patterns = manager.datetime_patterns
+        manager.datetime_patterns = _DATE_PATTERNS
+        yield manager
+        manager.datetime_patterns = original_patterns
 
-    def test_extract_date(self, manager):
+    @pytest.mark.parametrize("line,expected", [
+        ("2024-02-15 10:30:45 INFO Test", datetime(2024, 2, 15, 10, 30, 45)),
+        ("[Feb 15 10:30:45 2024] Test", datetime(2024, 2, 15, 10, 30, 45)),
+    ])
+    def test_extract_date(self, date_manager, line, expected):
         """Test date extraction from different log formats."""
-        # Override the datetime patterns to ensure proper matching
-        manager.datetime_patterns = [
-            (r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', '%Y-%m-%d %H:%M:%S'),
-            (r'\[([A-Za-z]{3} \d{2} \d{2}:\d{2}:\d{2} \d{4})\]', '%b %d %H:%M:%S %Y')
-        ]
-        
-        test_cases = [
-            {
-                'line': "2024-02-15 10:30:45 INFO Test",
-                'expected': datetime(2024, 2, 15, 10, 30, 45)
-            },
-            {
-                'line': "[Feb 15 10:30:45 2024] Test",
-                'expected': datetime(2024, 2, 15, 10, 30, 45)
-            }
-        ]
-        
-        for case in test_cases:
-            result = manager.extract_date(case['line'])
-            expected_date = case['expected']
-            
-            assert result is not None, f"Date extraction failed for: {case['line']}"
-            assert result.year == expected_date.year, f"Year mismatch for: {case['line']}"
-            assert result.month == expected_date.month, f"Month mismatch for: {case['line']}"
-            assert result.day == expected_date.day, f"Day mismatch for: {case['line']}"
-            assert result.hour == expected_date.hour, f"Hour mismatch for: {case['line']}"
-            assert result.minute == expected_date.minute, f"Minute mismatch for: {case['line']}"
-            assert result.second == expected_date.second, f"Second mismatch for: {case['line']}"
+        assert date_manager.extract_date(line) == expected
                     
-    def test_setup_cron_job(self, manager, temp_dir):
+    def test_extract_date_checks_separators(self, manager):
+        """Test a timestamp is only parsed when its separators match the pattern's format."""
+        manager.datetime_patterns = [(re.compile(r'(\d{4}/\d{2}/\d{2})'), '%Y-%m-%d')]
+        assert manager.extract_date("2024/02/15 INFO Test") is None
+
+    def test_setup_cron_job(self, manager, mock_cron, mock_cron_job, tmp_path):
         """Test cron job setup."""
-        # Create a mock for the CronTab instance
-        mock_cron = Mock()
-        mock_job = Mock()
-        mock_cron.new.return_value = mock_job
         manager.user_cron = mock_cron
         
         # Test successful job creation
         result = manager.setup_cron_job(
             "cleanup_script.py",
-            temp_dir,
+            str(tmp_path),
             hour=2,
             minute=30
         )
         
         assert result is True
         mock_cron.new.assert_called_once()
-        mock_job.setall.assert_called_with('30 2 * * *')
+        mock_cron_job.setall.assert_called_with('30 2 * * *')
+        mock_cron.write.assert_called_once()
+
+    def test_batch_cron(self, manager, mock_cron, tmp_path):
+        """Test batched cron changes write the crontab once."""
+        manager.user_cron = mock_cron
+
+        with manager.batch_cron():
+            assert manager.setup_cron_job("cleanup_script.py", str(tmp_path), hour=1) is True
+            assert manager.setup_cron_job("cleanup_script.py", str(tmp_path), hour=2) is True
+            mock_cron.write.assert_not_called()
+
+        assert mock_cron.new.call_count == 2
         mock_cron.write.assert_called_once()
 
-    def test_remove_cron_job(self, manager):
+    def test_remove_cron_job(self, manager, mock_cron, mock_cron_job):
         """Test cron job removal."""
-        # Create a mock for the CronTab instance
-        mock_cron = Mock()
-        mock_job = Mock()
-        mock_job.comment = f"{manager.job_comment_base}_test"
-        mock_cron.__iter__ = lambda self: iter([mock_job])
+        mock_cron_job.comment = f"{manager.job_comment_base}_test"
+        mock_cron.__iter__ = lambda self: iter([mock_cron_job])
         manager.user_cron = mock_cron
         
         result = manager.remove_cron_job()
         
         assert result is True
-        mock_cron.remove.assert_called_with(mock_job)
+        mock_cron.remove.assert_called_with(mock_cron_job)
         mock_cron.write.assert_called_once()
 
-    def test_has_cron_job(self, manager):
+    @pytest.mark.parametrize("comment,expected", [
+        ("{base}_test", True),  # Job created by the log cleaner
+        ("other_job", False),   # Unrelated job
+    ])
+    def test_has_cron_job(self, manager, mock_cron, mock_cron_job, comment, expected):
         """Test cron job detection."""
-        # Mock the user_cron attribute
-        mock_cron = Mock()
-        
-        # Test when job exists
-        job_with_matching_comment = Mock()
-        job_with_matching_comment.comment = f"{manager.job_comment_base}_test"
-        mock_cron.__iter__ = lambda self: iter([job_with_matching_comment])
+        mock_cron_job.comment = comment.format(base=manager.job_comment_base)
+        mock_cron.__iter__ = lambda self: iter([mock_cron_job])
         manager.user_cron = mock_cron
-        assert manager.has_cron_job() is True
         
-        # Test when no matching job exists
-        job_without_matching_comment = Mock()
-        job_without_matching_comment.comment = "other_job"
-        mock_cron.__iter__ = lambda self: iter([job_without_matching_comment])
-        manager.user_cron = mock_cron
-        assert manager.has_cron_job() is False
+        assert manager.has_cron_job() is expected